@@ -1,12 +1,23 @@
 import os
 import sys
-import time
-import json
+import signal
+import asyncio
 import logging
-from datetime import datetime
+import zoneinfo
+import functools
+import multiprocessing
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, time as dtime, timezone
+import cachetools
+import orjson
+import numpy as np
+import matplotlib
 from dotenv import load_dotenv
-import telegram
-from telegram.ext import Updater, CommandHandler, MessageHandler, Filters
+from telegram import Update
+from telegram.error import InvalidToken, TelegramError
+from telegram.ext import AIORateLimiter, ApplicationBuilder, CommandHandler, MessageHandler, filters
+from telegram.request import HTTPXRequest
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -16,6 +27,22 @@ TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 CHECK_INTERVAL = int(os.environ.get('CHECK_INTERVAL', 600))
 EOD_REPORT_TIME = os.environ.get('EOD_REPORT_TIME', '16:00')
 
+# Public base URL of this service; when set, Telegram pushes updates via webhook
+WEBHOOK_URL = os.environ.get('WEBHOOK_URL')
+WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET')
+PORT = int(os.environ.get('PORT', 8443))
+
+# Notification type -> user setting that enables it
+ALERT_SETTINGS = {
+    'price': 'price_alerts',
+    'signal': 'signal_alerts',
+    'news': 'news_alerts',
+    'eod': 'eod_reports'
+}
+
+# Render charts headless; set before the components import pyplot
+matplotlib.use('Agg')
+
 # Import all system components
 sys.path.append('/app')
 import gold_price_monitor
@@ -31,8 +58,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Gold monitor owned by a chart worker process, kept between jobs
+_worker_gold_monitor = None
+
+def _local_timezone():
+    """Return the zone named by TZ for scheduling, or UTC if it is unset or not a zone name"""
+    tz_name = os.environ.get('TZ', '').lstrip(':')
+    if not tz_name:
+        return timezone.utc
+        
+    try:
+        return zoneinfo.ZoneInfo(tz_name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError) as e:
+        logger.warning(f"Unknown TZ {tz_name!r} ({e}), scheduling EOD reports in UTC")
+        return timezone.utc
+
+@functools.lru_cache(maxsize=16)
+def _settings_message(price_alerts, signal_alerts, news_alerts, eod_reports):
+    """Build the /settings message; there are only 16 possible combinations"""
+    return (
+        "🔧 Notification Settings:\n\n"
+        f"Price Alerts: {'✅ ON' if price_alerts else '❌ OFF'}\n"
+        f"Signal Alerts: {'✅ ON' if signal_alerts else '❌ OFF'}\n"
+        f"News Alerts: {'✅ ON' if news_alerts else '❌ OFF'}\n"
+        f"EOD Reports: {'✅ ON' if eod_reports else '❌ OFF'}\n\n"
+        "To change settings, reply with:\n"
+        "price on/off\n"
+        "signal on/off\n"
+        "news on/off\n"
+        "eod on/off"
+    )
+
+def _read_chart(chart_path):
+    """Read a chart file, returning (chart_bytes, chart_key) where chart_key identifies this render"""
+    with open(chart_path, 'rb') as chart:
+        return chart.read(), (chart_path, os.fstat(chart.fileno()).st_mtime_ns)
+        
+def _fetch_live_snapshot():
+    """Fetch live data and the current price, or None if nothing was fetched (runs in a chart worker process)"""
+    global _worker_gold_monitor
+    if _worker_gold_monitor is None:
+        _worker_gold_monitor = gold_price_monitor.GoldPriceMonitor(interval='5m')
+        
+    data = _worker_gold_monitor.fetch_live_data()
+    if data is None or data.empty:
+        return None
+    return data, _worker_gold_monitor.get_current_price()
+    
+def _render_price_snapshot():
+    """Fetch live data and render the price chart, or None if nothing was fetched (runs in a chart worker process)"""
+    live = _fetch_live_snapshot()
+    if live is None:
+        return None
+        
+    # Remove the previous render so a failed plot cannot send a stale chart
+    chart_path = "/app/charts/current_price_chart.png"
+    try:
+        os.remove(chart_path)
+    except FileNotFoundError:
+        pass
+        
+    _worker_gold_monitor.plot_price_chart(save_path=chart_path)
+    return live + (_read_chart(chart_path),)
+    
+def _render_signal_snapshot(data):
+    """Generate signals and render the indicator chart (runs in a chart worker process)"""
+    ta = technical_analysis.TechnicalAnalysis(data)
+    signals = ta.generate_signals()
+    
+    if signals is None or signals.empty:
+        return None
+        
+    chart_path = "/app/charts/signal_chart.png"
+    ta.plot_indicators(signals, save_path=chart_path)
+    return signals.iloc[-1], _read_chart(chart_path)
+
 class TelegramNotifier:
-    def __init__(self, token, chat_id=None, check_interval=CHECK_INTERVAL):
+    def __init__(self, token, chat_id=None, check_interval=CHECK_INTERVAL, eod_report_time=EOD_REPORT_TIME):
         """
         Initialize the Telegram Notifier
         
@@ -40,21 +142,71 @@ class TelegramNotifier:
         token (str): Telegram Bot API token
         chat_id (str): Chat ID to send messages to (optional)
         check_interval (int): Interval between checks in seconds (default: from environment)
+        eod_report_time (str): Time to generate EOD report as HH:MM (default: from environment)
         """
         self.token = token
         self.chat_id = chat_id
         self.check_interval = check_interval
-        self.bot = telegram.Bot(token=token)
-        self.updater = Updater(token=token, use_context=True)
-        self.dispatcher = self.updater.dispatcher
+        self.eod_report_time = eod_report_time
+        self._eod_hour, self._eod_minute = map(int, eod_report_time.split(':'))
+        self._local_tz = _local_timezone()
+        self._last_eod_report_date = None
+        
+        # Updates from different chats are processed concurrently, so a slow
+        # /signal render in one chat does not hold up /price in another.
+        # Bot API calls share persistent HTTP/2 connections, so broadcasts are
+        # multiplexed over one TLS session instead of a handshake per send.
+        # The rate limiter paces all sends to Telegram's 30 messages per
+        # second and retries a send that still gets a 429 RetryAfter.
+        self.application = (
+            ApplicationBuilder()
+            .token(token)
+            .request(HTTPXRequest(http_version='2', connection_pool_size=256, pool_timeout=20))
+            .get_updates_request(HTTPXRequest(http_version='2'))
+            .rate_limiter(AIORateLimiter(max_retries=3))
+            .concurrent_updates(True)
+            .build()
+        )
+        self.bot = self.application.bot
+        self.job_queue = self.application.job_queue
         
         # Initialize trading assistant components
-        self.gold_monitor = gold_price_monitor.GoldPriceMonitor(interval='5m')
         self.news_monitor = news_monitor.NewsMonitor()
         self.notifier = notification_system.NotificationSystem(check_interval=check_interval)
         self.reporter = report_generator.ReportGenerator()
         
-        # Setup command handlers
+        # Network, pandas and matplotlib work runs here so polling keeps going.
+        # pyplot keeps global figure state, so in-process renders (check cycle,
+        # reports) are serialized by _chart_lock; _news_lock keeps the shared
+        # news monitor's fetch and read steps from interleaving between chats.
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="tg-io")
+        self._chart_lock = asyncio.Lock()
+        self._news_lock = asyncio.Lock()
+        
+        # /price and /signal charts render in worker processes, off the GIL and
+        # in parallel; _gold_lock/_signal_lock let one render serve a burst
+        self._chart_pool = self._new_chart_pool()
+        self._gold_lock = asyncio.Lock()
+        self._signal_lock = asyncio.Lock()
+        
+        # Caps in-flight Bot API sends across all broadcasts; the rate
+        # limiter above decides how many go out per second
+        self._send_sem = asyncio.Semaphore(25)
+        
+        # Bursts of /price and /signal reuse one fetch and render: live data
+        # and price, and the price chart, for 60 seconds, signals per latest candle
+        self._live_cache = cachetools.TTLCache(maxsize=2, ttl=60)
+        self._signal_cache = cachetools.LRUCache(maxsize=4)
+        
+        # Telegram file_id of charts already uploaded, keyed by (path, mtime)
+        # so a chart is uploaded once and then sent by reference
+        self._chart_file_ids = cachetools.TTLCache(maxsize=32, ttl=600)
+        
+        # Today's EOD report (message, chart and uploaded chart file_id), built
+        # once and reused for every later send and /report that day
+        self._eod_cache = {}
+        
+        # Setup command handlers; jobs are scheduled by run_monitoring
         self.setup_handlers()
         
         # Create necessary directories
@@ -66,57 +218,196 @@ class TelegramNotifier:
         # Store registered users
         self.users_file = '/app/data/telegram_users.json'
         self.users = self.load_users()
+        self._users_dirty = asyncio.Event()
+        self._users_flush_task = None
+        self._users_write = None
+        self._stop_event = asyncio.Event()
+        self.users_by_chat = {str(u['chat_id']): u for u in self.users['users']}
+        
+        # Chat IDs subscribed to each notification type
+        self._recipients_by_type = {notification_type: set() for notification_type in ALERT_SETTINGS}
+        for user in self.users['users']:
+            self._update_recipients(user)
         
     def load_users(self):
         """Load registered users from file"""
         if os.path.exists(self.users_file):
             try:
-                with open(self.users_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                with open(self.users_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
                 logger.error("Error decoding users file, creating new one")
                 return {'users': []}
         return {'users': []}
         
     def save_users(self):
         """Save registered users to file"""
+        self._write_users_file(orjson.dumps(self.users))
+        
+    def _write_users_file(self, payload):
+        """Atomically replace the users file, so a crash never leaves it half-written"""
+        tmp_path = self.users_file + '.tmp'
         try:
-            with open(self.users_file, 'w') as f:
-                json.dump(self.users, f, indent=4)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.users_file)
         except Exception as e:
             logger.error(f"Error saving users file: {e}")
             
+    async def _users_flush_loop(self):
+        """Write the users file in the background whenever it is marked dirty"""
+        while True:
+            await self._users_dirty.wait()
+            
+            # Coalesce bursts of setting changes into a single write
+            await asyncio.sleep(0.5)
+            self._users_dirty.clear()
+            
+            # Serialize on the event loop so the snapshot is consistent.
+            # The write is shielded: cancelling this loop cannot stop the
+            # pool thread, so shutdown waits on _users_write instead.
+            payload = orjson.dumps(self.users)
+            self._users_write = asyncio.ensure_future(self._run_io(self._write_users_file, payload))
+            await asyncio.shield(self._users_write)
+            
+    def _start_background_tasks(self):
+        """Start background tasks once the application is initialized"""
+        # Not Application.create_task: Application.stop() waits for those to
+        # finish, and this loop only ends when cancelled
+        self._users_flush_task = asyncio.create_task(self._users_flush_loop())
+        
+    async def _stop_background_tasks(self):
+        """Stop background tasks and flush pending user changes"""
+        if self._users_flush_task is not None:
+            self._users_flush_task.cancel()
+            try:
+                await self._users_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._users_flush_task = None
+            
+        # Let a write already running in the I/O pool finish first, so it
+        # cannot replace the file after the final save below
+        if self._users_write is not None:
+            await self._users_write
+            self._users_write = None
+            
+        if self._users_dirty.is_set():
+            self._users_dirty.clear()
+            self.save_users()
+            
     def register_user(self, chat_id, username=None):
         """Register a new user"""
-        if str(chat_id) not in [str(user['chat_id']) for user in self.users['users']]:
-            self.users['users'].append({
-                'chat_id': chat_id,
-                'username': username,
-                'registered_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'settings': {
-                    'price_alerts': True,
-                    'signal_alerts': True,
-                    'news_alerts': True,
-                    'eod_reports': True
-                }
-            })
-            self.save_users()
-            return True
-        return False
+        key = str(chat_id)
+        if key in self.users_by_chat:
+            return False
+            
+        new_user = {
+            'chat_id': chat_id,
+            'username': username,
+            'registered_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'settings': {
+                'price_alerts': True,
+                'signal_alerts': True,
+                'news_alerts': True,
+                'eod_reports': True
+            }
+        }
+        self.users['users'].append(new_user)
+        self.users_by_chat[key] = new_user
+        self._update_recipients(new_user)
+        self._users_dirty.set()
+        return True
+        
+    def _update_recipients(self, user):
+        """Sync a user's notification subscriptions with their settings"""
+        chat_id = str(user['chat_id'])
+        for notification_type, setting in ALERT_SETTINGS.items():
+            if user['settings'][setting]:
+                self._recipients_by_type[notification_type].add(chat_id)
+            else:
+                self._recipients_by_type[notification_type].discard(chat_id)
+                
+    def _recipients(self, notification_type):
+        """Return the users subscribed to a notification type"""
+        return [self.users_by_chat[chat_id] for chat_id in self._recipients_by_type.get(notification_type, ())]
+        
+    async def _run_io(self, func, *args, **kwargs):
+        """Run a blocking call in the I/O thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, functools.partial(func, *args, **kwargs))
+        
+    def _new_chart_pool(self):
+        """Create the chart worker processes"""
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        
+    async def _run_chart(self, func, *args):
+        """Run a chart job in the chart worker processes, restarting them once if one died"""
+        loop = asyncio.get_running_loop()
+        pool = self._chart_pool
+        try:
+            return await loop.run_in_executor(pool, functools.partial(func, *args))
+        except BrokenProcessPool:
+            # A dead worker breaks the pool for every later job; only the
+            # first caller to notice replaces it
+            if self._chart_pool is pool:
+                logger.error("Chart worker process died, restarting chart workers")
+                pool.shutdown(wait=False)
+                self._chart_pool = self._new_chart_pool()
+            return await loop.run_in_executor(self._chart_pool, functools.partial(func, *args))
+        
+    def _read_attached_chart(self, data):
+        """Read data['chart_path'] if there is one, returning None when there is no chart"""
+        try:
+            return _read_chart(data['chart_path'])
+        except (KeyError, TypeError, FileNotFoundError):
+            return None
+        except OSError as e:
+            # Send without the chart rather than abort the remaining notifications
+            logger.error(f"Error reading chart {data['chart_path']}: {e}")
+            return None
+
+    async def _reply_chart(self, message, chart, caption):
+        """Reply with a chart, reusing its file_id if it was already uploaded"""
+        chart_bytes, chart_key = chart
+        file_id = self._chart_file_ids.get(chart_key)
+        if file_id is not None:
+            await message.reply_photo(photo=file_id, caption=caption)
+            return
+            
+        sent = await message.reply_photo(photo=chart_bytes, caption=caption)
+        self._chart_file_ids[chart_key] = sent.photo[-1].file_id
         
     def setup_handlers(self):
         """Setup command handlers"""
-        self.dispatcher.add_handler(CommandHandler("start", self.start_command))
-        self.dispatcher.add_handler(CommandHandler("help", self.help_command))
-        self.dispatcher.add_handler(CommandHandler("price", self.price_command))
-        self.dispatcher.add_handler(CommandHandler("signal", self.signal_command))
-        self.dispatcher.add_handler(CommandHandler("news", self.news_command))
-        self.dispatcher.add_handler(CommandHandler("report", self.report_command))
-        self.dispatcher.add_handler(CommandHandler("settings", self.settings_command))
-        self.dispatcher.add_handler(MessageHandler(Filters.text & ~Filters.command, self.handle_message))
-        self.dispatcher.add_error_handler(self.error_handler)
-        
-    def start_command(self, update, context):
+        self.application.add_handler(CommandHandler("start", self.start_command))
+        self.application.add_handler(CommandHandler("help", self.help_command))
+        self.application.add_handler(CommandHandler("price", self.price_command))
+        self.application.add_handler(CommandHandler("signal", self.signal_command))
+        self.application.add_handler(CommandHandler("news", self.news_command))
+        self.application.add_handler(CommandHandler("report", self.report_command))
+        self.application.add_handler(CommandHandler("settings", self.settings_command))
+        self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
+        self.application.add_error_handler(self.error_handler)
+        
+    def setup_jobs(self):
+        """Setup scheduled check cycle and EOD report jobs, replacing any left from an earlier start"""
+        for job in self.job_queue.jobs():
+            job.schedule_removal()
+            
+        self._check_job = self.job_queue.run_repeating(self._async_check_cycle, interval=self.check_interval)
+        
+        # EOD report time is given in the TZ zone. Use the named zone, not
+        # the current UTC offset, so it follows DST changes.
+        eod_time = dtime(self._eod_hour, self._eod_minute, tzinfo=self._local_tz)
+        self._eod_job = self.job_queue.run_daily(self._async_eod, time=eod_time)
+        
+    async def start_command(self, update, context):
         """Handle /start command"""
         chat_id = update.effective_chat.id
         username = update.effective_user.username
@@ -137,9 +428,9 @@ class TelegramNotifier:
                 "Use /help to see available commands."
             )
             
-        context.bot.send_message(chat_id=chat_id, text=message)
+        await context.bot.send_message(chat_id=chat_id, text=message)
         
-    def help_command(self, update, context):
+    async def help_command(self, update, context):
         """Handle /help command"""
         help_text = (
             "XAU/USD Trading Assistant Commands:\n\n"
@@ -150,48 +441,96 @@ class TelegramNotifier:
             "/settings - Manage notification settings\n"
             "/help - Show this help message"
         )
-        update.message.reply_text(help_text)
+        await update.message.reply_text(help_text)
+        
+    async def _cached_live(self, key, job):
+        """Return the cached result of a live data worker job, refreshed at most every 60 seconds"""
+        snapshot = self._live_cache.get(key)
+        if snapshot is not None:
+            return snapshot
+            
+        async with self._gold_lock:
+            # Another chat may have refreshed it while we waited for the lock
+            snapshot = self._live_cache.get(key)
+            if snapshot is not None:
+                return snapshot
+                
+            snapshot = await self._run_chart(job)
+            
+            # Nothing fetched is not cached, so the next request tries again.
+            # A chart render fetched fresh data too, which /signal can reuse.
+            if snapshot is not None:
+                self._live_cache[key] = snapshot
+                self._live_cache['data'] = snapshot[:2]
+            return snapshot
+            
+    async def _cached_live_data(self):
+        """Return (data, current_price), or None if no data could be fetched"""
+        return await self._cached_live('data', _fetch_live_snapshot)
         
-    def price_command(self, update, context):
+    async def _cached_price_chart(self):
+        """Return (data, current_price, chart), or None if no data could be fetched"""
+        return await self._cached_live('chart', _render_price_snapshot)
+            
+    async def _cached_signal(self, data):
+        """Return (latest_signal, chart) for the latest candle in data, or None"""
+        bar_time = data.index[-1]
+        snapshot = self._signal_cache.get(bar_time)
+        if snapshot is not None:
+            return snapshot
+            
+        async with self._signal_lock:
+            snapshot = self._signal_cache.get(bar_time)
+            if snapshot is not None:
+                return snapshot
+                
+            # Generate signals and chart
+            snapshot = await self._run_chart(_render_signal_snapshot, data)
+            
+            if snapshot is not None:
+                self._signal_cache[bar_time] = snapshot
+            return snapshot
+            
+    async def price_command(self, update, context):
         """Handle /price command"""
         try:
-            update.message.reply_text("Fetching current gold price...")
+            await update.message.reply_text("Fetching current gold price...")
             
-            # Get current price
-            self.gold_monitor.fetch_live_data()
-            current_price = self.gold_monitor.get_current_price()
+            # Get current price and chart
+            snapshot = await self._cached_price_chart()
             
-            # Generate price chart
-            chart_path = "/app/charts/current_price_chart.png"
-            self.gold_monitor.plot_price_chart(save_path=chart_path)
+            if snapshot is None:
+                await update.message.reply_text("Failed to fetch gold price data.")
+                return
+                
+            _, current_price, chart = snapshot
             
             # Send price information
             message = f"💰 Current XAU/USD Price: ${current_price:.2f}"
             
             # Send message with chart
-            with open(chart_path, 'rb') as chart:
-                update.message.reply_photo(photo=chart, caption=message)
+            await self._reply_chart(update.message, chart, message)
                 
         except Exception as e:
             logger.error(f"Error in price command: {e}")
-            update.message.reply_text(f"Error fetching price: {str(e)}")
+            await update.message.reply_text(f"Error fetching price: {str(e)}")
             
-    def signal_command(self, update, context):
+    async def signal_command(self, update, context):
         """Handle /signal command"""
         try:
-            update.message.reply_text("Generating latest trading signal...")
+            await update.message.reply_text("Generating latest trading signal...")
             
             # Fetch data and generate signal
-            data = self.gold_monitor.fetch_live_data()
-            ta = technical_analysis.TechnicalAnalysis(data)
-            signals = ta.generate_signals()
+            live = await self._cached_live_data()
+            signal = None if live is None else await self._cached_signal(live[0])
             
-            if signals is None or signals.empty:
-                update.message.reply_text("Failed to generate trading signals.")
+            if signal is None:
+                await update.message.reply_text("Failed to generate trading signals.")
                 return
                 
             # Get latest signal
-            latest_signal = signals.iloc[-1]
+            _, current_price = live
+            latest_signal, chart = signal
             signal_value = latest_signal['Signal']
             
             # Determine signal type
@@ -202,12 +541,7 @@ class TelegramNotifier:
             else:
                 signal_type = "⚪ NEUTRAL"
                 
-            # Generate chart
-            chart_path = "/app/charts/signal_chart.png"
-            ta.plot_indicators(signals, save_path=chart_path)
-            
             # Create message
-            current_price = self.gold_monitor.get_current_price()
             message = (
                 f"📊 XAU/USD Trading Signal: {signal_type}\n\n"
                 f"💰 Current Price: ${current_price:.2f}\n"
@@ -226,366 +560,487 @@ class TelegramNotifier:
                 message += "MACD is BEARISH (MACD line below Signal line).\n"
                 
             # Send message with chart
-            with open(chart_path, 'rb') as chart:
-                update.message.reply_photo(photo=chart, caption=message)
+            await self._reply_chart(update.message, chart, message)
                 
         except Exception as e:
             logger.error(f"Error in signal command: {e}")
-            update.message.reply_text(f"Error generating signal: {str(e)}")
+            await update.message.reply_text(f"Error generating signal: {str(e)}")
             
-    def news_command(self, update, context):
+    async def news_command(self, update, context):
         """Handle /news command"""
         try:
-            update.message.reply_text("Fetching latest gold news...")
-            
-            # Fetch news
-            news = self.news_monitor.fetch_all_news()
+            await update.message.reply_text("Fetching latest gold news...")
             
+            async with self._news_lock:
+                # Fetch news
+                news = await self._run_io(self.news_monitor.fetch_all_news)
+                
+                # Get latest news
+                if news is not None and not news.empty:
+                    latest_news = self.news_monitor.get_latest_news(limit=5)
+                    
             if news is None or news.empty:
-                update.message.reply_text("No gold-related news found.")
+                await update.message.reply_text("No gold-related news found.")
                 return
-                
-            # Get latest news
-            latest_news = self.news_monitor.get_latest_news(limit=5)
             
-            # Create message
-            message = "📰 Latest Gold News:\n\n"
+            # Create message, formatting all rows at once. map(str) formats each
+            # value like an f-string; astype(str) keeps missing values missing
+            # on pandas 3, which would turn the whole line into NaN.
+            impact = latest_news['impact']
+            impact_label = np.select([impact >= 0.8, impact >= 0.6], ["🔴 High", "🟠 Medium"], default="🟡 Low")
+            lines = (
+                "[" + latest_news['source'].map(str) + "] " + latest_news['title'].map(str)
+                + "\n   Impact: " + impact_label + " (" + impact.map('{:.2f}'.format) + ")"
+                + "\n   " + latest_news['url'].map(str)
+            ).tolist()
             
-            for i, (_, row) in enumerate(latest_news.iterrows()):
-                impact = "🔴 High" if row['impact'] >= 0.8 else "🟠 Medium" if row['impact'] >= 0.6 else "🟡 Low"
-                message += f"{i+1}. [{row['source']}] {row['title']}\n"
-                message += f"   Impact: {impact} ({row['impact']:.2f})\n"
-                message += f"   {row['url']}\n\n"
+            message = "📰 Latest Gold News:\n\n" + "".join(f"{i+1}. {line}\n\n" for i, line in enumerate(lines))
                 
-            update.message.reply_text(message)
+            await update.message.reply_text(message)
                 
         except Exception as e:
             logger.error(f"Error in news command: {e}")
-            update.message.reply_text(f"Error fetching news: {str(e)}")
+            await update.message.reply_text(f"Error fetching news: {str(e)}")
             
-    def report_command(self, update, context):
+    async def report_command(self, update, context):
         """Handle /report command"""
         try:
-            update.message.reply_text("Generating EOD report...")
+            await update.message.reply_text("Generating EOD report...")
             
-            # Generate EOD report
-            report_data = self.notifier.generate_eod_report()
+            # Reuse today's EOD report once it has been sent
+            eod = self._cached_eod_report()
             
-            if report_data is None:
-                update.message.reply_text("Failed to generate EOD report.")
-                return
-                
-            # Generate HTML report
-            report_path = self.reporter.generate_eod_report(report_data)
-            
-            if report_path is None:
-                update.message.reply_text("Failed to generate HTML report.")
-                return
+            if eod is not None:
+                report_message = eod['message']
+                chart = eod['chart']
+            else:
+                # Generate EOD report
+                async with self._chart_lock:
+                    report_data = await self._run_io(self.notifier.generate_eod_report)
+                    
+                if report_data is None:
+                    await update.message.reply_text("Failed to generate EOD report.")
+                    return
+                    
+                # Generate HTML report
+                async with self._chart_lock:
+                    report_path = await self._run_io(self.reporter.generate_eod_report, report_data)
                 
-            # Format report message
-            report_message = self.notifier.format_eod_report_message(report_data)
+                if report_path is None:
+                    await update.message.reply_text("Failed to generate HTML report.")
+                    return
+                    
+                # Format report message
+                report_message = self.notifier.format_eod_report_message(report_data)
+                chart = self._read_attached_chart(report_data)
             
             # Send report message
-            update.message.reply_text(report_message)
+            await update.message.reply_text(report_message)
             
             # Send chart if available
-            if 'chart_path' in report_data and os.path.exists(report_data['chart_path']):
-                with open(report_data['chart_path'], 'rb') as chart:
-                    update.message.reply_photo(photo=chart, caption="EOD Chart")
+            if chart is not None:
+                await self._reply_chart(update.message, chart, "EOD Chart")
                     
         except Exception as e:
             logger.error(f"Error in report command: {e}")
-            update.message.reply_text(f"Error generating report: {str(e)}")
+            await update.message.reply_text(f"Error generating report: {str(e)}")
             
-    def settings_command(self, update, context):
+    async def settings_command(self, update, context):
         """Handle /settings command"""
         chat_id = str(update.effective_chat.id)
         
         # Find user
-        user = None
-        for u in self.users['users']:
-            if str(u['chat_id']) == chat_id:
-                user = u
-                break
+        user = self.users_by_chat.get(chat_id)
                 
         if user is None:
-            update.message.reply_text("You are not registered. Use /start to register.")
+            await update.message.reply_text("You are not registered. Use /start to register.")
             return
             
         # Get current settings
         settings = user['settings']
         
         # Create message
-        message = (
-            "🔧 Notification Settings:\n\n"
-            f"Price Alerts: {'✅ ON' if settings['price_alerts'] else '❌ OFF'}\n"
-            f"Signal Alerts: {'✅ ON' if settings['signal_alerts'] else '❌ OFF'}\n"
-            f"News Alerts: {'✅ ON' if settings['news_alerts'] else '❌ OFF'}\n"
-            f"EOD Reports: {'✅ ON' if settings['eod_reports'] else '❌ OFF'}\n\n"
-            "To change settings, reply with:\n"
-            "price on/off\n"
-            "signal on/off\n"
-            "news on/off\n"
-            "eod on/off"
+        message = _settings_message(
+            settings['price_alerts'],
+            settings['signal_alerts'],
+            settings['news_alerts'],
+            settings['eod_reports']
         )
         
-        update.message.reply_text(message)
+        await update.message.reply_text(message)
         
-    def handle_message(self, update, context):
+    async def handle_message(self, update, context):
         """Handle text messages"""
         chat_id = str(update.effective_chat.id)
         text = update.message.text.lower()
         
         # Find user
-        user = None
-        for u in self.users['users']:
-            if str(u['chat_id']) == chat_id:
-                user = u
-                break
+        user = self.users_by_chat.get(chat_id)
                 
         if user is None:
-            update.message.reply_text("You are not registered. Use /start to register.")
+            await update.message.reply_text("You are not registered. Use /start to register.")
             return
             
         # Handle settings changes
         if text.startswith('price '):
             value = text.split(' ')[1].lower() == 'on'
             user['settings']['price_alerts'] = value
-            self.save_users()
-            update.message.reply_text(f"Price alerts turned {'ON' if value else 'OFF'}")
+            self._update_recipients(user)
+            self._users_dirty.set()
+            await update.message.reply_text(f"Price alerts turned {'ON' if value else 'OFF'}")
             
         elif text.startswith('signal '):
             value = text.split(' ')[1].lower() == 'on'
             user['settings']['signal_alerts'] = value
-            self.save_users()
-            update.message.reply_text(f"Signal alerts turned {'ON' if value else 'OFF'}")
+            self._update_recipients(user)
+            self._users_dirty.set()
+            await update.message.reply_text(f"Signal alerts turned {'ON' if value else 'OFF'}")
             
         elif text.startswith('news '):
             value = text.split(' ')[1].lower() == 'on'
             user['settings']['news_alerts'] = value
-            self.save_users()
-            update.message.reply_text(f"News alerts turned {'ON' if value else 'OFF'}")
+            self._update_recipients(user)
+            self._users_dirty.set()
+            await update.message.reply_text(f"News alerts turned {'ON' if value else 'OFF'}")
             
         elif text.startswith('eod '):
             value = text.split(' ')[1].lower() == 'on'
             user['settings']['eod_reports'] = value
-            self.save_users()
-            update.message.reply_text(f"EOD reports turned {'ON' if value else 'OFF'}")
+            self._update_recipients(user)
+            self._users_dirty.set()
+            await update.message.reply_text(f"EOD reports turned {'ON' if value else 'OFF'}")
             
         else:
-            update.message.reply_text("I don't understand that command. Use /help to see available commands.")
+            await update.message.reply_text("I don't understand that command. Use /help to see available commands.")
             
-    def error_handler(self, update, context):
+    async def error_handler(self, update, context):
         """Handle errors"""
         logger.error(f"Update {update} caused error {context.error}")
         
-    def send_message_to_all(self, message, parse_mode=None):
-        """Send message to all registered users"""
-        for user in self.users['users']:
+    async def _send_one(self, user, send):
+        """Run a send coroutine for one user, bounded by the send semaphore"""
+        async with self._send_sem:
+            return await send(user)
+            
+    async def _broadcast(self, recipients, send, description):
+        """Send to all recipients concurrently and log failures per user"""
+        results = await asyncio.gather(
+            *(self._send_one(user, send) for user in recipients),
+            return_exceptions=True
+        )
+        for user, result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending {description} to {user['chat_id']}: {result}")
+                
+    async def _broadcast_photo(self, recipients, chart, send, description):
+        """
+        Broadcast with a chart attached, uploading the chart only once
+        
+        send(user, photo) must return the sent photo message. The chart is
+        uploaded to recipients one at a time until Telegram returns a file_id,
+        which is then used for everyone else.
+        """
+        chart_bytes, chart_key = chart
+        file_id = self._chart_file_ids.get(chart_key)
+        remaining = list(recipients)
+        
+        while file_id is None and remaining:
+            user = remaining.pop(0)
             try:
-                self.bot.send_message(chat_id=user['chat_id'], text=message, parse_mode=parse_mode)
+                sent = await self._send_one(user, functools.partial(send, photo=chart_bytes))
+                file_id = sent.photo[-1].file_id
+                self._chart_file_ids[chart_key] = file_id
             except Exception as e:
-                logger.error(f"Error sending message to {user['chat_id']}: {e}")
+                logger.error(f"Error sending {description} to {user['chat_id']}: {e}")
+                
+        if remaining:
+            await self._broadcast(remaining, functools.partial(send, photo=file_id), description)
+                
+    def _today(self):
+        """Return today's date in the zone the EOD report is scheduled in"""
+        return datetime.now(self._local_tz).date()
+        
+    def _cached_eod_report(self):
+        """Return today's cached EOD report, or None if it has not been built yet"""
+        eod = self._eod_cache.get(self._today())
+        
+        # The file_id outlives the 10 minute chart cache, so put it back there
+        if eod is not None and eod['file_id'] is not None:
+            self._chart_file_ids[eod['chart'][1]] = eod['file_id']
+        return eod
+        
+    async def send_message_to_all(self, message, parse_mode=None):
+        """Send message to all registered users"""
+        async def send(user):
+            await self.bot.send_message(chat_id=user['chat_id'], text=message, parse_mode=parse_mode)
+            
+        await self._broadcast(self.users['users'], send, "message")
                 
-    def send_photo_to_all(self, photo_path, caption=None, parse_mode=None):
+    async def send_photo_to_all(self, photo_path, caption=None, parse_mode=None):
         """Send photo to all registered users"""
-        for user in self.users['users']:
-            try:
-                with open(photo_path, 'rb') as photo:
-                    self.bot.send_photo(chat_id=user['chat_id'], photo=photo, caption=caption, parse_mode=parse_mode)
-            except Exception as e:
-                logger.error(f"Error sending photo to {user['chat_id']}: {e}")
+        try:
+            chart = _read_chart(photo_path)
+        except Exception as e:
+            logger.error(f"Error reading photo {photo_path}: {e}")
+            return
+            
+        async def send(user, photo):
+            return await self.bot.send_photo(chat_id=user['chat_id'], photo=photo, caption=caption, parse_mode=parse_mode)
+            
+        await self._broadcast_photo(self.users['users'], chart, send, "photo")
                 
-    def send_notification(self, notification):
+    async def send_notification(self, notification):
         """Send notification to users based on their settings"""
         notification_type = notification['type']
         title = notification['title']
         message = notification['message']
         
         # Determine which users should receive this notification
-        recipients = []
-        for user in self.users['users']:
-            settings = user['settings']
-            
-            if notification_type == 'price' and settings['price_alerts']:
-                recipients.append(user)
-            elif notification_type == 'signal' and settings['signal_alerts']:
-                recipients.append(user)
-            elif notification_type == 'news' and settings['news_alerts']:
-                recipients.append(user)
+        recipients = self._recipients(notification_type)
                 
+        # Read the chart once for all recipients
+        chart = self._read_attached_chart(notification.get('data'))
+                        
         # Send notification to recipients
         full_message = f"🔔 {title}\n\n{message}"
         
-        for user in recipients:
-            try:
-                self.bot.send_message(chat_id=user['chat_id'], text=full_message)
-                
-                # If there's a chart, send it
-                if 'data' in notification and notification['data'] is not None:
-                    if 'chart_path' in notification['data'] and notification['data']['chart_path'] is not None:
-                        chart_path = notification['data']['chart_path']
-                        if os.path.exists(chart_path):
-                            with open(chart_path, 'rb') as chart:
-                                self.bot.send_photo(chat_id=user['chat_id'], photo=chart)
-            except Exception as e:
-                logger.error(f"Error sending notification to {user['chat_id']}: {e}")
-                
-    def send_eod_report(self, report_data):
-        """Send EOD report to users who have enabled it"""
-        if report_data is None:
-            logger.error("No report data to send")
-            return
+        async def send(user, photo=None):
+            await self.bot.send_message(chat_id=user['chat_id'], text=full_message)
             
-        # Generate HTML report
-        report_path = self.reporter.generate_eod_report(report_data)
+            # If there's a chart, send it
+            if photo is not None:
+                return await self.bot.send_photo(chat_id=user['chat_id'], photo=photo)
+                
+        if chart is None:
+            await self._broadcast(recipients, send, "notification")
+        else:
+            await self._broadcast_photo(recipients, chart, send, "notification")
+                
+    async def send_eod_report(self, report_data):
+        """
+        Send EOD report to users who have enabled it
         
-        if report_path is None:
-            logger.error("Failed to generate HTML report")
-            return
+        The HTML report, message and chart are built once per day; if today's
+        report is already cached, report_data may be None.
+        """
+        eod = self._cached_eod_report()
+        
+        if eod is None:
+            if report_data is None:
+                logger.error("No report data to send")
+                return
+                
+            # Generate HTML report
+            async with self._chart_lock:
+                report_path = await self._run_io(self.reporter.generate_eod_report, report_data)
             
-        # Format report message
-        report_message = self.notifier.format_eod_report_message(report_data)
+            if report_path is None:
+                logger.error("Failed to generate HTML report")
+                return
+                
+            # Format report message and read the chart once for all recipients
+            eod = {
+                'message': self.notifier.format_eod_report_message(report_data),
+                'chart': self._read_attached_chart(report_data),
+                'file_id': None
+            }
+            self._eod_cache = {self._today(): eod}
+            
+        report_message = eod['message']
+        chart = eod['chart']
         
         # Determine which users should receive this report
-        recipients = []
-        for user in self.users['users']:
-            if user['settings']['eod_reports']:
-                recipients.append(user)
+        recipients = self._recipients('eod')
                 
         # Send report to recipients
-        for user in recipients:
-            try:
-                self.bot.send_message(chat_id=user['chat_id'], text=report_message)
+        async def send(user, photo=None):
+            await self.bot.send_message(chat_id=user['chat_id'], text=report_message)
+            
+            # Send chart if available
+            if photo is not None:
+                return await self.bot.send_photo(chat_id=user['chat_id'], photo=photo, caption="EOD Chart")
                 
-                # Send chart if available
-                if 'chart_path' in report_data and os.path.exists(report_data['chart_path']):
-                    with open(report_data['chart_path'], 'rb') as chart:
-                        self.bot.send_photo(chat_id=user['chat_id'], photo=chart, caption="EOD Chart")
-            except Exception as e:
-                logger.error(f"Error sending EOD report to {user['chat_id']}: {e}")
+        if chart is None:
+            await self._broadcast(recipients, send, "EOD report")
+        else:
+            await self._broadcast_photo(recipients, chart, send, "EOD report")
+            eod['file_id'] = self._chart_file_ids.get(chart[1])
                 
-    def run_check_cycle(self):
+    async def run_check_cycle(self):
         """Run a complete check cycle and send notifications"""
         logger.info("Running check cycle...")
         
         try:
             # Run check cycle
-            notifications = self.notifier.run_check_cycle()
+            async with self._chart_lock:
+                notifications = await self._run_io(self.notifier.run_check_cycle)
             
             if notifications:
                 logger.info(f"Generated {len(notifications)} notifications")
                 
                 # Send notifications
                 for notification in notifications:
-                    self.send_notification(notification)
+                    await self.send_notification(notification)
             else:
                 logger.info("No notifications generated")
                 
         except Exception as e:
             logger.error(f"Error in check cycle: {e}")
             
-    def generate_and_send_eod_report(self):
+    async def generate_and_send_eod_report(self):
         """Generate and send EOD report"""
         logger.info("Generating EOD report...")
         
         try:
+            # Today's report is only built once
+            if self._cached_eod_report() is not None:
+                logger.info("Reusing today's EOD report")
+                await self.send_eod_report(None)
+                return
+                
             # Generate EOD report
-            report_data = self.notifier.generate_eod_report()
+            async with self._chart_lock:
+                report_data = await self._run_io(self.notifier.generate_eod_report)
             
             if report_data:
                 logger.info("EOD report generated")
                 
                 # Send EOD report
-                self.send_eod_report(report_data)
+                await self.send_eod_report(report_data)
             else:
                 logger.error("Failed to generate EOD report")
                 
         except Exception as e:
             logger.error(f"Error generating EOD report: {e}")
             
-    def start_polling(self):
+    async def _async_check_cycle(self, context):
+        """Job callback for the repeating check cycle"""
+        await self.run_check_cycle()
+        
+    async def _async_eod(self, context):
+        """Job callback for the daily EOD report"""
+        current_date = self._today()
+        if self._last_eod_report_date == current_date:
+            return
+            
+        self._last_eod_report_date = current_date
+        await self.generate_and_send_eod_report()
+        
+    async def start_polling(self):
         """Start polling for Telegram updates"""
-        self.updater.start_polling()
+        # Long polling: Telegram holds each getUpdates open for up to 30 seconds
+        # and answers as soon as an update arrives, and poll_interval=0 sends the
+        # next request immediately. Updates reach us with no added delay while
+        # an idle bot costs only one request per 30 seconds. Only messages are
+        # requested, since no other update type has a handler.
+        await self.application.updater.start_polling(
+            poll_interval=0,
+            timeout=30,
+            allowed_updates=[Update.MESSAGE]
+        )
         logger.info("Bot started polling")
         
+    async def start_webhook(self):
+        """Start receiving Telegram updates via webhook"""
+        await self.application.updater.start_webhook(
+            listen='0.0.0.0',
+            port=PORT,
+            url_path=self.token,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{self.token}",
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=[Update.MESSAGE]
+        )
+        logger.info(f"Bot listening for webhook updates on port {PORT}")
+        
     def stop_polling(self):
-        """Stop polling for Telegram updates"""
-        self.updater.stop()
-        logger.info("Bot stopped polling")
+        """Stop receiving Telegram updates, ending run_monitoring"""
+        self._stop_event.set()
+        logger.info("Bot stopping")
         
-    def run_monitoring(self, eod_report_time=EOD_REPORT_TIME):
+    async def run_monitoring(self):
         """
         Run continuous monitoring
         
-        Parameters:
-        eod_report_time (str): Time to generate EOD report (default: from environment)
+        Check cycles and EOD reports are driven by the job queue, so this
+        only waits on receiving updates (webhook if WEBHOOK_URL is set,
+        long polling otherwise) until stop_polling() is called.
         """
         logger.info(f"Starting continuous monitoring every {self.check_interval} seconds")
-        logger.info(f"EOD report time: {eod_report_time}")
+        logger.info(f"EOD report time: {self.eod_report_time}")
         
-        # Start polling
-        self.start_polling()
-        
-        last_eod_report_date = None
-        
-        try:
-            while True:
-                # Run check cycle
-                self.run_check_cycle()
-                
-                # Check if it's time for EOD report
-                current_time = datetime.now()
-                current_time_str = current_time.strftime('%H:%M')
-                current_date = current_time.date()
-                
-                if current_time_str >= eod_report_time and last_eod_report_date != current_date:
-                    self.generate_and_send_eod_report()
-                    last_eod_report_date = current_date
+        async with self.application:
+            try:
+                if WEBHOOK_URL:
+                    await self.start_webhook()
+                else:
+                    await self.start_polling()
                     
-                # Sleep until next check
-                logger.info(f"Sleeping for {self.check_interval} seconds...")
-                time.sleep(self.check_interval)
+                # Application.stop() shuts the scheduler down and its jobs are
+                # lost, so they are scheduled again on every start
+                self.setup_jobs()
+                await self.application.start()
+                self._start_background_tasks()
                 
-        except KeyboardInterrupt:
-            logger.info("Monitoring stopped by user")
-        except Exception as e:
-            logger.error(f"Error in monitoring: {e}")
-            # Implement retry mechanism
-            logger.info("Restarting monitoring in 60 seconds...")
-            time.sleep(60)
-            self.run_monitoring(eod_report_time)
-        finally:
-            self.stop_polling()
+                # APScheduler cannot schedule a job for "now", so run the first
+                # check directly, and today's EOD report if we start after its time
+                self.application.create_task(self._check_job.run(self.application))
+                now = datetime.now(self._local_tz)
+                if (now.hour, now.minute) >= (self._eod_hour, self._eod_minute):
+                    self.application.create_task(self._eod_job.run(self.application))
+                    
+                await self._stop_event.wait()
+            finally:
+                if self.application.updater.running:
+                    await self.application.updater.stop()
+                if self.application.running:
+                    await self.application.stop()
+                await self._stop_background_tasks()
+                
+        logger.info("Monitoring stopped")
 
-def main():
+async def main():
     # Get Telegram bot token from environment variable
     token = TELEGRAM_BOT_TOKEN
     if not token:
         logger.error("TELEGRAM_BOT_TOKEN environment variable not set")
         sys.exit(1)
+        
+    # Without the secret anyone who finds the URL could post fake updates
+    if WEBHOOK_URL and not WEBHOOK_SECRET:
+        logger.error("WEBHOOK_URL is set but WEBHOOK_SECRET is not; refusing to start an unverified webhook")
+        sys.exit(1)
             
-    # Create TelegramNotifier
-    notifier = TelegramNotifier(token=token, check_interval=CHECK_INTERVAL)
+    # Create TelegramNotifier inside the running loop, so its asyncio
+    # locks and events belong to it
+    notifier = TelegramNotifier(token=token, check_interval=CHECK_INTERVAL, eod_report_time=EOD_REPORT_TIME)
     
-    # Run monitoring with retry mechanism
-    max_retries = 5
+    # Shut down cleanly on Ctrl+C and on the platform's SIGTERM
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, notifier.stop_polling)
+        
+    # Run monitoring, restarting with exponential backoff on Telegram errors
     retry_count = 0
     
-    while retry_count < max_retries:
+    while True:
         try:
-            notifier.run_monitoring(eod_report_time=EOD_REPORT_TIME)
+            await notifier.run_monitoring()
             break
-        except Exception as e:
+        except InvalidToken as e:
+            logger.error(f"Invalid Telegram bot token, exiting: {e}")
+            sys.exit(1)
+        except TelegramError as e:
+            backoff = min(60 * 2 ** retry_count, 900)
             retry_count += 1
-            logger.error(f"Error in main loop (retry {retry_count}/{max_retries}): {e}")
-            if retry_count < max_retries:
-                sleep_time = 60 * retry_count  # Exponential backoff
-                logger.info(f"Restarting in {sleep_time} seconds...")
-                time.sleep(sleep_time)
-            else:
-                logger.error("Maximum retries reached, exiting")
-                sys.exit(1)
+            logger.error(f"Error in main loop (retry {retry_count}): {e}")
+            logger.info(f"Restarting in {backoff} seconds...")
+            
+            # Wait out the backoff, but stop right away on SIGINT/SIGTERM
+            try:
+                await asyncio.wait_for(notifier._stop_event.wait(), backoff)
+                break
+            except asyncio.TimeoutError:
+                pass
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())